@@ -75,29 +75,51 @@ const isLoopbackRequest = (request: NextRequest): boolean => {
   ].some((value) => isLoopbackHostname(value));
 };
 
-export const buildContentSecurityPolicy = (
-  nonce: string,
-  allowInlineScripts: boolean,
-  extraConnectSrc: readonly string[] = [],
-): string => [
+// Only the script-src nonce and the optional dev connect-src entries vary per
+// request, so the constant directive runs are joined once at module load.
+const CSP_HEAD = [
   "default-src 'self'",
   "base-uri 'self'",
   "frame-ancestors 'none'",
   "object-src 'none'",
-  allowInlineScripts
-    ? "script-src 'self' 'unsafe-inline' 'unsafe-eval' 'wasm-unsafe-eval' https://apis.google.com https://www.gstatic.com https://static.cloudflareinsights.com"
-    : `script-src 'self' 'nonce-${nonce}' 'wasm-unsafe-eval' https://apis.google.com https://www.gstatic.com https://static.cloudflareinsights.com`,
+].join('; ');
+
+const CSP_INLINE_SCRIPT_SRC = "script-src 'self' 'unsafe-inline' 'unsafe-eval' 'wasm-unsafe-eval' https://apis.google.com https://www.gstatic.com https://static.cloudflareinsights.com";
+
+const CSP_MID = [
   "style-src 'self' 'unsafe-inline' https://fonts.googleapis.com",
   "font-src 'self' https://fonts.gstatic.com data:",
   "img-src 'self' blob: data: https:",
   "media-src 'self' blob: data: https:",
-  `connect-src ${[...CSP_CONNECT_SRC, ...extraConnectSrc].join(' ')}`,
+].join('; ');
+
+const CSP_CONNECT_SRC_VALUE = CSP_CONNECT_SRC.join(' ');
+
+const CSP_TAIL = [
   "worker-src 'self' blob:",
   "frame-src 'self' https://accounts.google.com https://*.google.com https://*.firebaseapp.com",
   "manifest-src 'self'",
 ].join('; ');
 
-const isProtectedRoute = (pathname: string): boolean => PROTECTED_ROUTES.some((route) => pathname.startsWith(route));
+export const buildContentSecurityPolicy = (
+  nonce: string,
+  allowInlineScripts: boolean,
+  extraConnectSrc: readonly string[] = [],
+): string => [
+  CSP_HEAD,
+  allowInlineScripts
+    ? CSP_INLINE_SCRIPT_SRC
+    : `script-src 'self' 'nonce-${nonce}' 'wasm-unsafe-eval' https://apis.google.com https://www.gstatic.com https://static.cloudflareinsights.com`,
+  CSP_MID,
+  extraConnectSrc.length > 0
+    ? `connect-src ${CSP_CONNECT_SRC_VALUE} ${extraConnectSrc.join(' ')}`
+    : `connect-src ${CSP_CONNECT_SRC_VALUE}`,
+  CSP_TAIL,
+].join('; ');
+
+const PROTECTED_ROUTE_PATTERN = new RegExp(`^(?:${PROTECTED_ROUTES.join('|')})`);
+
+const isProtectedRoute = (pathname: string): boolean => PROTECTED_ROUTE_PATTERN.test(pathname);
 
 const applySecurityHeaders = (response: NextResponse, nonce: string, csp: string): NextResponse => {
   response.headers.set('Content-Security-Policy', csp);
@@ -155,6 +155,9 @@ const PLAN_CONFIGS: Record<PlanConfig['key'], PlanConfig> = {
 const asString = (value: unknown): string => String(value ?? '').trim();
 const asLower = (value: unknown): string => asString(value).toLowerCase();
 const asNumber = (value: unknown, fallback = 0): number => {
+  if (typeof value === 'number') {
+    return Number.isFinite(value) ? value : fallback;
+  }
   const next = Number(value);
   return Number.isFinite(next) ? next : fallback;
 };
@@ -189,16 +192,25 @@ const currentUtc = (): Date => new Date();
 const toMonthKey = (date: Date): string => `${date.getUTCFullYear()}-${String(date.getUTCMonth() + 1).padStart(2, '0')}`;
 const toDayKey = (date: Date): string => `${date.getUTCFullYear()}-${String(date.getUTCMonth() + 1).padStart(2, '0')}-${String(date.getUTCDate()).padStart(2, '0')}`;
 
+let cachedMonthWindow: { key: string; window: { start: string; end: string } } | null = null;
+let cachedDayWindow: { key: string; window: { start: string; end: string } } | null = null;
+
 const monthWindowUtc = (date: Date): { start: string; end: string } => {
+  const key = toMonthKey(date);
+  if (cachedMonthWindow?.key === key) return cachedMonthWindow.window;
   const start = new Date(Date.UTC(date.getUTCFullYear(), date.getUTCMonth(), 1, 0, 0, 0, 0));
   const end = new Date(Date.UTC(date.getUTCFullYear(), date.getUTCMonth() + 1, 1, 0, 0, 0, 0));
-  return { start: start.toISOString(), end: end.toISOString() };
+  cachedMonthWindow = { key, window: { start: start.toISOString(), end: end.toISOString() } };
+  return cachedMonthWindow.window;
 };
 
 const dayWindowUtc = (date: Date): { start: string; end: string } => {
+  const key = toDayKey(date);
+  if (cachedDayWindow?.key === key) return cachedDayWindow.window;
   const start = new Date(Date.UTC(date.getUTCFullYear(), date.getUTCMonth(), date.getUTCDate(), 0, 0, 0, 0));
   const end = new Date(Date.UTC(date.getUTCFullYear(), date.getUTCMonth(), date.getUTCDate() + 1, 0, 0, 0, 0));
-  return { start: start.toISOString(), end: end.toISOString() };
+  cachedDayWindow = { key, window: { start: start.toISOString(), end: end.toISOString() } };
+  return cachedDayWindow.window;
 };
 
 const isAdminUser = (user: ServerAuthedUserContext): boolean => {
@@ -219,10 +231,15 @@ const normalizePlanKey = (value: unknown): PlanConfig['key'] => {
 
 const getPlanConfig = (value: unknown): PlanConfig => PLAN_CONFIGS[normalizePlanKey(value)];
 
+const MONTHLY_PLAN_CAPS = Object.fromEntries(
+  Object.entries(PLAN_CONFIGS).map(([key, value]) => [key, value.monthlyVfLimit]),
+);
+
 const normalizeUserIdCandidate = (value: unknown): string => {
+  // A run of anything non-alphanumeric (underscores included) collapses to
+  // one underscore, so the sanitize and collapse steps fuse into one pass.
   let token = asLower(value)
-    .replace(/[^a-z0-9_]+/g, '_')
-    .replace(/_+/g, '_')
+    .replace(/[^a-z0-9]+/g, '_')
     .replace(/^_+|_+$/g, '');
   if (!token) return '';
   if (!/^[a-z]/.test(token)) token = `u_${token}`;
@@ -293,16 +310,19 @@ const defaultAccountProfile = (
 
 export const serializeAccountProfileForFirestore = (
   profile: AccountUserProfile
-): Record<string, unknown> => ({
-  uid: profile.uid,
-  userId: profile.userId || '',
-  displayName: profile.displayName || '',
-  email: profile.email || '',
-  billingProfile: profile.billingProfile || null,
-  status: profile.status || 'active',
-  createdAt: profile.createdAt || new Date().toISOString(),
-  updatedAt: profile.updatedAt || new Date().toISOString(),
-});
+): Record<string, unknown> => {
+  const fallbackIso = new Date().toISOString();
+  return {
+    uid: profile.uid,
+    userId: profile.userId || '',
+    displayName: profile.displayName || '',
+    email: profile.email || '',
+    billingProfile: profile.billingProfile || null,
+    status: profile.status || 'active',
+    createdAt: profile.createdAt || fallbackIso,
+    updatedAt: profile.updatedAt || fallbackIso,
+  };
+};
 
 const mergeProfile = (user: ServerAuthedUserContext, profileData: Record<string, unknown> | null): AccountUserProfile => {
   const profile = defaultAccountProfile(user);
@@ -496,24 +516,24 @@ const normalizeByEngineUsage = (value: unknown): Record<'VECTOR' | 'PRIME', { ch
 export const getAccountEntitlements = async (user: ServerAuthedUserContext): Promise<AccountEntitlements> => {
   const now = currentUtc();
   const planFallback = getPlanConfig(user.userData?.plan);
+  const monthKey = toMonthKey(now);
+  const dayKey = toDayKey(now);
   const entitlementsRef = firestore().collection(COLLECTIONS.entitlements).doc(user.uid);
-  const snapshot = await entitlementsRef.get();
+  const [snapshot, monthlyUsage, dailyUsage] = await Promise.all([
+    entitlementsRef.get(),
+    readUsageDocForPeriod(COLLECTIONS.usageMonthly, user.uid, monthKey),
+    readUsageDocForPeriod(COLLECTIONS.usageDaily, user.uid, dayKey),
+  ]);
   const entitlementDoc: Record<string, unknown> = snapshot.exists
-    ? { ...defaultEntitlementDoc(user.uid, planFallback.key), ...(snapshot.data() || {}) }
+    ? Object.assign(defaultEntitlementDoc(user.uid, planFallback.key), snapshot.data() || {})
     : defaultEntitlementDoc(user.uid, planFallback.key);
   if (!snapshot.exists) {
     await entitlementsRef.set(entitlementDoc, { merge: true });
   }
 
   const plan = getPlanConfig(entitlementDoc.plan);
-  const monthKey = toMonthKey(now);
-  const dayKey = toDayKey(now);
   const monthlyWindow = monthWindowUtc(now);
   const dailyWindow = dayWindowUtc(now);
-  const [monthlyUsage, dailyUsage] = await Promise.all([
-    readUsageDocForPeriod(COLLECTIONS.usageMonthly, user.uid, monthKey),
-    readUsageDocForPeriod(COLLECTIONS.usageDaily, user.uid, dayKey),
-  ]);
   const monthlyByEngine = normalizeByEngineUsage(monthlyUsage?.byEngine);
   const dailyByEngine = normalizeByEngineUsage(dailyUsage?.byEngine);
   const monthlyVfUsed = asPositiveNumber(monthlyUsage?.vfUsed);
@@ -551,7 +571,7 @@ export const getAccountEntitlements = async (user: ServerAuthedUserContext): Pro
     },
     limits: {
       vfRates: { VECTOR: 1, PRIME: 1 },
-      monthlyPlanCaps: Object.fromEntries(Object.entries(PLAN_CONFIGS).map(([key, value]) => [key, value.monthlyVfLimit])),
+      monthlyPlanCaps: MONTHLY_PLAN_CAPS,
       maxCharsPerGeneration: asPositiveInt(entitlementDoc.maxCharsPerGeneration, plan.maxCharsPerGeneration),
       allowedEngines: (Array.isArray(entitlementDoc.allowedEngines) && entitlementDoc.allowedEngines.length > 0
         ? entitlementDoc.allowedEngines
@@ -785,11 +805,7 @@ export const getNotificationPreferences = async (user: ServerAuthedUserContext):
     updatedAt: new Date().toISOString(),
   };
   const snapshot = await firestore().collection(COLLECTIONS.notificationPreferences).doc(user.uid).get();
-  return {
-    ...defaults,
-    ...(snapshot.data() || {}),
-    uid: user.uid,
-  };
+  return Object.assign(defaults, snapshot.data() || {}, { uid: user.uid });
 };
 
 export const patchNotificationPreferences = async (
@@ -876,7 +892,9 @@ export const createSupportMessage = async (
   const conversationId = asString(input.conversationId) || randomUUID();
   const conversationRef = firestore().collection(COLLECTIONS.supportConversations).doc(conversationId);
   const existing = await conversationRef.get();
-  if (existing.exists && asString(existing.data()?.uid) !== user.uid) {
+  // Snapshot.data() deserializes on every call, so read it once.
+  const existingData = existing.exists ? (existing.data() || {}) : {};
+  if (existing.exists && asString(existingData.uid) !== user.uid) {
     throw new Error('Support conversation not found.');
   }
 
@@ -885,10 +903,10 @@ export const createSupportMessage = async (
     uid: user.uid,
     userId: userProfile.userId || '',
     status: existing.exists
-      ? (asString(existing.data()?.status) || (automation.needsHuman ? 'needs_human' : 'open'))
+      ? (asString(existingData.status) || (automation.needsHuman ? 'needs_human' : 'open'))
       : (automation.needsHuman ? 'needs_human' : 'open'),
     priority: existing.exists
-      ? (asString(existing.data()?.priority) || automation.priority)
+      ? (asString(existingData.priority) || automation.priority)
       : automation.priority,
     category: automation.category,
     lastMessagePreview: text.slice(0, 240),
@@ -922,12 +940,14 @@ export const createSupportMessage = async (
     createdAt: nowIso,
   }, { merge: true });
 
-  const messagesSnapshot = await firestore().collection(COLLECTIONS.supportMessages).where('conversationId', '==', conversationId).get();
+  const [messagesSnapshot, conversationDoc] = await Promise.all([
+    firestore().collection(COLLECTIONS.supportMessages).where('conversationId', '==', conversationId).get(),
+    conversationRef.get(),
+  ]);
   const messages = messagesSnapshot.docs
     .map((doc) => normalizeSupportMessage(doc))
     .sort((left, right) => asNumber(Date.parse(String(left.createdAt || ''))) - asNumber(Date.parse(String(right.createdAt || ''))));
 
-  const conversationDoc = await conversationRef.get();
   return {
     conversation: normalizeSupportConversation(conversationDoc as QueryDocumentSnapshot),
     messages,
@@ -996,25 +1016,31 @@ export const deleteUserAccount = async (
 
   const profile = await ensureAccountProfile(user, { autoBootstrap: false });
   const userId = asString(profile.userId);
-  const summary: Record<string, { deletedCount: number; failedCount: number }> = {};
+  type DeletionOutcome = { deletedCount: number; failedCount: number };
 
-  const track = async (name: string, operation: () => Promise<number>) => {
+  const track = async (
+    name: string,
+    operation: () => Promise<number>
+  ): Promise<[string, DeletionOutcome]> => {
     try {
       const deletedCount = await operation();
-      summary[name] = { deletedCount, failedCount: 0 };
+      return [name, { deletedCount, failedCount: 0 }];
     } catch {
-      summary[name] = { deletedCount: 0, failedCount: 1 };
+      return [name, { deletedCount: 0, failedCount: 1 }];
     }
   };
 
-  await track(COLLECTIONS.entitlements, () => deleteDirectDoc(COLLECTIONS.entitlements, user.uid));
-  await track(COLLECTIONS.users, () => deleteDirectDoc(COLLECTIONS.users, user.uid));
-  await track(COLLECTIONS.userProfiles, () => deleteDirectDoc(COLLECTIONS.userProfiles, user.uid));
-  await track(COLLECTIONS.generationHistory, () => deleteDirectDoc(COLLECTIONS.generationHistory, user.uid));
-  await track(COLLECTIONS.notificationPreferences, () => deleteDirectDoc(COLLECTIONS.notificationPreferences, user.uid));
-  await track(COLLECTIONS.notificationInbox, () => deleteNotificationInbox(user.uid));
-  await track(COLLECTIONS.readerLegalAck, () => deleteDirectDoc(COLLECTIONS.readerLegalAck, user.uid));
-  await track(COLLECTIONS.userIdIndex, async () => (userId ? deleteDirectDoc(COLLECTIONS.userIdIndex, userId) : 0));
+  // Each collection is independent, so the deletions run concurrently.
+  const directDeletions = [
+    track(COLLECTIONS.entitlements, () => deleteDirectDoc(COLLECTIONS.entitlements, user.uid)),
+    track(COLLECTIONS.users, () => deleteDirectDoc(COLLECTIONS.users, user.uid)),
+    track(COLLECTIONS.userProfiles, () => deleteDirectDoc(COLLECTIONS.userProfiles, user.uid)),
+    track(COLLECTIONS.generationHistory, () => deleteDirectDoc(COLLECTIONS.generationHistory, user.uid)),
+    track(COLLECTIONS.notificationPreferences, () => deleteDirectDoc(COLLECTIONS.notificationPreferences, user.uid)),
+    track(COLLECTIONS.notificationInbox, () => deleteNotificationInbox(user.uid)),
+    track(COLLECTIONS.readerLegalAck, () => deleteDirectDoc(COLLECTIONS.readerLegalAck, user.uid)),
+    track(COLLECTIONS.userIdIndex, async () => (userId ? deleteDirectDoc(COLLECTIONS.userIdIndex, userId) : 0)),
+  ];
 
   const uidCollections = [
     COLLECTIONS.usageMonthly,
@@ -1037,9 +1063,11 @@ export const deleteUserAccount = async (
     COLLECTIONS.stripeCustomers,
   ];
 
-  for (const collectionName of uidCollections) {
-    await track(collectionName, () => deleteDocsByUid(collectionName, user.uid));
-  }
+  const outcomes = await Promise.all([
+    ...directDeletions,
+    ...uidCollections.map((collectionName) => track(collectionName, () => deleteDocsByUid(collectionName, user.uid))),
+  ]);
+  const summary = Object.fromEntries(outcomes) as Record<string, DeletionOutcome>;
 
   try {
     await getFirebaseAdminAuth().deleteUser(user.uid);
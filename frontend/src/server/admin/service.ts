@@ -267,10 +267,12 @@ const getFirestoreHandle = () => {
 const listRecords = async (collectionName: string): Promise<Array<{ id: string; data: AnyRecord }>> => {
   const firestore = getFirestoreHandle();
   if (!firestore) {
-    return Array.from(getCollection(collectionName).entries()).map(([id, data]) => ({ id, data: cloneRecord(data) }));
+    // Writers always replace entries with fresh dicts, so reads share references.
+    return Array.from(getCollection(collectionName).entries()).map(([id, data]) => ({ id, data }));
   }
   const snapshot = await firestore.collection(collectionName).get();
-  return snapshot.docs.map((doc) => ({ id: doc.id, data: cloneRecord(doc.data() as AnyRecord) }));
+  // doc.data() already returns a caller-owned object, so no defensive copy is needed.
+  return snapshot.docs.map((doc) => ({ id: doc.id, data: doc.data() as AnyRecord }));
 };
 
 const readRecord = async (collectionName: string, id: string): Promise<AnyRecord | null> => {
@@ -278,10 +280,10 @@ const readRecord = async (collectionName: string, id: string): Promise<AnyRecord
   if (!safeId) return null;
   const firestore = getFirestoreHandle();
   if (!firestore) {
-    return cloneRecord(getCollection(collectionName).get(safeId) || null);
+    return getCollection(collectionName).get(safeId) || null;
   }
   const snapshot = await firestore.collection(collectionName).doc(safeId).get();
-  return snapshot.exists ? cloneRecord(snapshot.data() as AnyRecord) : null;
+  return snapshot.exists ? (snapshot.data() as AnyRecord) : null;
 };
 
 const writeRecord = async (collectionName: string, id: string, data: AnyRecord, merge = true): Promise<AnyRecord> => {
@@ -293,7 +295,7 @@ const writeRecord = async (collectionName: string, id: string, data: AnyRecord,
     const previous = merge ? (collection.get(safeId) || {}) : {};
     const next = merge ? { ...previous, ...nextValue } : nextValue;
     collection.set(safeId, next);
-    return cloneRecord(next);
+    return next;
   }
   await firestore.collection(collectionName).doc(safeId).set(nextValue, { merge });
   return (await readRecord(collectionName, safeId)) || {};
@@ -1007,7 +1009,21 @@ const patchCouponHandler = async (request: NextRequest, couponId: string): Promi
   return json({ coupon: { id: couponId, ...coupon } });
 };
 
+// Admin dashboards poll the status endpoints every few seconds; a short TTL
+// collapses those bursts into one slot lookup without hiding real changes.
+const GEMINI_SLOTS_CACHE_TTL_MS = 2_000;
+let cachedGeminiSlots: { expiresAtMs: number; slots: AnyRecord[] } | null = null;
+
 const buildGeminiSlots = async (): Promise<AnyRecord[]> => {
+  if (cachedGeminiSlots && cachedGeminiSlots.expiresAtMs > nowMs()) {
+    return cachedGeminiSlots.slots;
+  }
+  const slots = await buildGeminiSlotsUncached();
+  cachedGeminiSlots = { expiresAtMs: nowMs() + GEMINI_SLOTS_CACHE_TTL_MS, slots };
+  return slots;
+};
+
+const buildGeminiSlotsUncached = async (): Promise<AnyRecord[]> => {
   const rows = await queryRecords(COLLECTIONS.adminGeminiSlots, {
     sort: (left, right) => asString(left.data.slotId).localeCompare(asString(right.data.slotId)),
   });
@@ -1255,14 +1271,24 @@ const resetDailyUsageAllHandler = async (request: NextRequest): Promise<Response
 const integrationsUsageHandler = async (request: NextRequest): Promise<Response> => {
   await requirePermission(request, 'ops.read');
   const jobs = await queryRecords(COLLECTIONS.opsGuardianActions);
+  // One pass over the job records instead of a filtered array per counter.
+  let completedJobs = 0;
+  let failedJobs = 0;
+  let pendingJobs = 0;
+  for (const row of jobs) {
+    const status = asString(row.data.status);
+    if (status === 'completed') completedJobs += 1;
+    else if (status === 'failed') failedJobs += 1;
+    else if (status === 'pending') pendingJobs += 1;
+  }
   return json({
     ok: true,
     windows: {
       total: {
         requests: jobs.length,
-        success: jobs.filter((row) => asString(row.data.status) === 'completed').length,
+        success: completedJobs,
         clientErrors: 0,
-        serverErrors: jobs.filter((row) => asString(row.data.status) === 'failed').length,
+        serverErrors: failedJobs,
         errorRatePct: 0,
         avgLatencyMs: 0,
         p95LatencyMs: 0,
@@ -1274,7 +1300,7 @@ const integrationsUsageHandler = async (request: NextRequest): Promise<Response>
       { integration: 'primary-ai', windows: { total: { requests: 0, success: 0, clientErrors: 0, serverErrors: 0, errorRatePct: 0, avgLatencyMs: 0, p95LatencyMs: 0, maxLatencyMs: 0 } } },
     ],
     gateway: getReplatformRuntimeSummary(),
-    jobQueue: { pending: jobs.filter((row) => asString(row.data.status) === 'pending').length },
+    jobQueue: { pending: pendingJobs },
   });
 };
 
@@ -2410,8 +2436,12 @@ const buildBudgetView = (
         : toRecommendedMoneyActions(budget),
     };
   });
-  const criticalCount = items.filter((item) => item.riskState === 'critical').length;
-  const warningCount = items.filter((item) => item.riskState === 'warning').length;
+  let criticalCount = 0;
+  let warningCount = 0;
+  for (const item of items) {
+    if (item.riskState === 'critical') criticalCount += 1;
+    else if (item.riskState === 'warning') warningCount += 1;
+  }
   return {
     items,
     riskState: criticalCount > 0 ? 'critical' : warningCount > 0 ? 'warning' : 'ok',
@@ -136,10 +136,9 @@ export const generateReaderScript = async (
     throw new Error('text is required.');
   }
 
-  const fallback = buildFallbackScript(safeText);
   if (!isVertexTextConfigured()) {
     return {
-      annotatedText: fallback,
+      annotatedText: buildFallbackScript(safeText),
       source: 'fallback',
     };
   }
@@ -157,7 +156,7 @@ export const generateReaderScript = async (
     };
   } catch {
     return {
-      annotatedText: fallback,
+      annotatedText: buildFallbackScript(safeText),
       source: 'fallback',
     };
   }
@@ -124,6 +124,30 @@ const buildJobId = (request: AudioNovelJobRequest): string => {
 const buildAudioKey = (bookId: string, chapterId: string, hash: string): string => `audio/${bookId}/${chapterId}/${hash}.mp3`;
 const buildSyncKey = (bookId: string, chapterId: string, hash: string): string => `audio/${bookId}/${chapterId}/${hash}.sync.json`;
 
+const AUDIO_NOVEL_SYNTH_CONCURRENCY = 4;
+
+const synthesizeRunBuffers = async (
+  runs: AudioNovelSpeakerRun[],
+  encoding: 'MP3' | 'LINEAR16',
+  maxRetries: number,
+): Promise<Buffer[]> => {
+  const buffers: Buffer[] = new Array(runs.length);
+  let nextIndex = 0;
+  const worker = async (): Promise<void> => {
+    while (nextIndex < runs.length) {
+      const index = nextIndex;
+      nextIndex += 1;
+      const run = runs[index];
+      buffers[index] = run
+        ? await synthesizeAudioNovelRun(run, encoding, maxRetries)
+        : Buffer.alloc(0);
+    }
+  };
+  const workerCount = Math.min(AUDIO_NOVEL_SYNTH_CONCURRENCY, runs.length);
+  await Promise.all(Array.from({ length: workerCount }, () => worker()));
+  return buffers;
+};
+
 const buildSyncMap = (runs: AudioNovelSpeakerRun[], buffers: Buffer[]): AudioNovelRunSyncEntry[] => {
   const syncEntries: AudioNovelRunSyncEntry[] = [];
   let byteOffset = 0;
@@ -256,11 +280,7 @@ const generatePublishedChapterAudio = async (
     })),
   );
 
-  const buffers: Buffer[] = [];
-  for (const run of runs) {
-    const audio = await synthesizeAudioNovelRun(run, 'MP3', 5);
-    buffers.push(audio);
-  }
+  const buffers = await synthesizeRunBuffers(runs, 'MP3', 5);
 
   const stitched = Buffer.concat(buffers.filter((buffer) => buffer.length > 0));
   if (stitched.length < 1_000) {
@@ -269,8 +289,10 @@ const generatePublishedChapterAudio = async (
 
   const syncEntries = buildSyncMap(runs, buffers);
   const generatedAt = new Date().toISOString();
-  await writeAudioNovelObject(audioKey, stitched, 'audio/mpeg');
-  await writeAudioNovelObject(syncKey, JSON.stringify(syncEntries), 'application/json; charset=utf-8');
+  await Promise.all([
+    writeAudioNovelObject(audioKey, stitched, 'audio/mpeg'),
+    writeAudioNovelObject(syncKey, JSON.stringify(syncEntries), 'application/json; charset=utf-8'),
+  ]);
   await updateChapterAudioMetadata(request.bookId, request.chapterId, {
     audioKey,
     syncKey,
@@ -527,7 +549,8 @@ export const streamAudioNovelLive = async (
     transport: canUseBidi ? 'bidi' : 'run',
   });
 
-  const startedAt = Date.now();
+  // Monotonic clock so the reported duration survives wall-clock adjustments.
+  const startedAtMs = globalThis.performance.now();
   if (canUseBidi) {
     let emittedBidiAudio = false;
     try {
@@ -541,7 +564,7 @@ export const streamAudioNovelLive = async (
       send({
         done: true,
         totalRuns: 1,
-        durationMs: Date.now() - startedAt,
+        durationMs: Math.round(globalThis.performance.now() - startedAtMs),
       });
       return;
     } catch (error) {
@@ -550,7 +573,7 @@ export const streamAudioNovelLive = async (
           error: 'Live audio stream was interrupted before completion. Please retry.',
           code: 'BIDI_STREAM_INTERRUPTED',
           partial: true,
-          durationMs: Date.now() - startedAt,
+          durationMs: Math.round(globalThis.performance.now() - startedAtMs),
         });
         return;
       }
@@ -583,6 +606,6 @@ export const streamAudioNovelLive = async (
   send({
     done: true,
     totalRuns: runs.length,
-    durationMs: Date.now() - startedAt,
+    durationMs: Math.round(globalThis.performance.now() - startedAtMs),
   });
 };
@@ -65,10 +65,44 @@ export const verifyFirebaseSessionCookie = async (sessionCookie: string): Promis
   return getFirebaseAdminAuth().verifySessionCookie(String(sessionCookie || '').trim(), true);
 };
 
+const DECODED_TOKEN_CACHE_MAX_ENTRIES = 2_048;
+const DECODED_TOKEN_CACHE_TTL_MS = 5 * 60 * 1000;
+
+const decodedTokenCache = new Map<string, { decoded: DecodedIdToken; expiresAtMs: number }>();
+
+const readCachedDecodedToken = (token: string): DecodedIdToken | null => {
+  const entry = decodedTokenCache.get(token);
+  if (!entry) return null;
+  if (entry.expiresAtMs <= Date.now()) {
+    decodedTokenCache.delete(token);
+    return null;
+  }
+  return entry.decoded;
+};
+
+const cacheDecodedToken = (token: string, decoded: DecodedIdToken): void => {
+  const tokenExpMs = Number(decoded.exp || 0) * 1000;
+  const expiresAtMs = Math.min(
+    tokenExpMs > 0 ? tokenExpMs : Number.MAX_SAFE_INTEGER,
+    Date.now() + DECODED_TOKEN_CACHE_TTL_MS,
+  );
+  if (expiresAtMs <= Date.now()) return;
+  if (decodedTokenCache.size >= DECODED_TOKEN_CACHE_MAX_ENTRIES) {
+    const oldestKey = decodedTokenCache.keys().next().value;
+    if (oldestKey !== undefined) decodedTokenCache.delete(oldestKey);
+  }
+  decodedTokenCache.set(token, { decoded, expiresAtMs });
+};
+
 export const verifyFirebaseHeaders = async (headers: HeaderSource): Promise<DecodedIdToken> => {
   try {
     const token = extractBearerToken(readHeaderValue(headers, 'authorization'));
-    return getFirebaseAdminAuth().verifyIdToken(token);
+    const cached = readCachedDecodedToken(token);
+    if (cached) return cached;
+    return getFirebaseAdminAuth().verifyIdToken(token).then((decoded) => {
+      cacheDecodedToken(token, decoded);
+      return decoded;
+    });
   } catch (bearerError) {
     const sessionCookie = readCookieValueFromHeader(readHeaderValue(headers, 'cookie'), SESSION_COOKIE_NAME);
     if (sessionCookie) {
@@ -21,6 +21,8 @@ import {
 } from '../../features/billing/catalog';
 import { readEnvNumber, readEnvValue } from '../../shared/runtime/env';
 import { BILLING_CHECKOUT_LOCK_MESSAGE, isBillingCheckoutLocked } from '../../shared/billing/checkoutLock';
+import { FieldValue } from 'firebase-admin/firestore';
+
 import type { ServerAuthedUserContext } from '../auth/requestAuth.ts';
 import { getFirebaseAdminFirestore } from '../firebaseAdmin';
 import { getAccountEntitlements, getAccountProfile } from '../account/service';
@@ -700,13 +702,12 @@ export const redeemCoupon = async (
   const existingRedemption = await redemptionRef.get();
   if (existingRedemption.exists) throwHttpError(409, 'Coupon already redeemed by this user.');
 
+  const redeemedAt = currentIso();
   await firestore().runTransaction(async (transaction) => {
     const entRef = getEntitlementsRef(user.uid);
-    const entSnap = await transaction.get(entRef);
-    const entitlement = (entSnap.data() || {}) as Record<string, unknown>;
     transaction.set(entRef, {
-      paidVfBalance: asPositiveNumber(entitlement.paidVfBalance) + creditedVf,
-      updatedAt: currentIso(),
+      paidVfBalance: FieldValue.increment(creditedVf),
+      updatedAt: redeemedAt,
     }, { merge: true });
     transaction.set(redemptionRef, {
       id: redemptionId,
@@ -716,7 +717,7 @@ export const redeemCoupon = async (
       creditedVf,
       channel: 'wallet',
       status: 'redeemed',
-      createdAt: currentIso(),
+      createdAt: redeemedAt,
     }, { merge: true });
     transaction.set(firestore().collection('wallet_transactions').doc(`coupon_wallet_${couponDoc.id}_${user.uid}`), {
       uid: user.uid,
@@ -725,7 +726,7 @@ export const redeemCoupon = async (
       amount: creditedVf,
       reason: 'coupon_redeem',
       metadata: { couponId: couponDoc.id, code, channel: 'wallet' },
-      createdAt: currentIso(),
+      createdAt: redeemedAt,
     }, { merge: true });
   });
 
@@ -748,6 +749,7 @@ export const convertWalletVfToVc = async (
   const operationId = replayToken ? `vf_to_vc:${normalizeOperationToken(user.uid)}:${replayToken}` : '';
   const operationRef = operationId ? getBillingOperationRef(operationId) : null;
 
+  const convertedAt = currentIso();
   const outcome = await firestore().runTransaction(async (transaction) => {
     const entRef = getEntitlementsRef(user.uid);
     const [entSnap, operationSnap] = await Promise.all([
@@ -771,7 +773,7 @@ export const convertWalletVfToVc = async (
       paidVfBalance: currentBalance - vfAmount,
       vcPaidBalance: asPositiveNumber(entitlement.vcPaidBalance) + vcCredited,
       vcSpendableBalance: asPositiveNumber(entitlement.vcSpendableBalance) + vcCredited,
-      updatedAt: currentIso(),
+      updatedAt: convertedAt,
     }, { merge: true });
     transaction.set(firestore().collection('wallet_transactions').doc(walletTransactionId), {
       uid: user.uid,
@@ -779,7 +781,7 @@ export const convertWalletVfToVc = async (
       bucket: 'vcPaid',
       amount: vcCredited,
       metadata: { vfDebited: vfAmount, rate, ...(replayToken ? { replayToken } : {}) },
-      createdAt: currentIso(),
+      createdAt: convertedAt,
     }, { merge: true });
     if (operationRef) {
       transaction.set(operationRef, {
@@ -790,8 +792,8 @@ export const convertWalletVfToVc = async (
         vfDebited: vfAmount,
         vcCredited,
         rate,
-        createdAt: currentIso(),
-        updatedAt: currentIso(),
+        createdAt: convertedAt,
+        updatedAt: convertedAt,
       }, { merge: true });
     }
     return { vfDebited: vfAmount, vcCredited };
@@ -838,43 +840,28 @@ const processCheckoutCompletion = async (session: Record<string, unknown>): Prom
   }
 
   if (kind === 'token-pack') {
-    await firestore().runTransaction(async (transaction) => {
-      const entRef = getEntitlementsRef(uid);
-      const entSnap = await transaction.get(entRef);
-      const entitlement = (entSnap.data() || {}) as Record<string, unknown>;
-      transaction.set(entRef, {
-        paidVfBalance: asPositiveNumber(entitlement.paidVfBalance) + asPositiveNumber(metadata.packVf),
-        updatedAt: currentIso(),
-      }, { merge: true });
-    });
+    await getEntitlementsRef(uid).set({
+      paidVfBalance: FieldValue.increment(asPositiveNumber(metadata.packVf)),
+      updatedAt: currentIso(),
+    }, { merge: true });
     return;
   }
 
   if (kind === 'vc-token-pack') {
-    await firestore().runTransaction(async (transaction) => {
-      const entRef = getEntitlementsRef(uid);
-      const entSnap = await transaction.get(entRef);
-      const entitlement = (entSnap.data() || {}) as Record<string, unknown>;
-      const credited = asPositiveNumber(metadata.packVc);
-      transaction.set(entRef, {
-        vcPaidBalance: asPositiveNumber(entitlement.vcPaidBalance) + credited,
-        vcSpendableBalance: asPositiveNumber(entitlement.vcSpendableBalance) + credited,
-        updatedAt: currentIso(),
-      }, { merge: true });
-    });
+    const credited = asPositiveNumber(metadata.packVc);
+    await getEntitlementsRef(uid).set({
+      vcPaidBalance: FieldValue.increment(credited),
+      vcSpendableBalance: FieldValue.increment(credited),
+      updatedAt: currentIso(),
+    }, { merge: true });
     return;
   }
 
   if (kind === 'vn-token-pack') {
-    await firestore().runTransaction(async (transaction) => {
-      const entRef = getEntitlementsRef(uid);
-      const entSnap = await transaction.get(entRef);
-      const entitlement = (entSnap.data() || {}) as Record<string, unknown>;
-      transaction.set(entRef, {
-        vnBalance: asPositiveNumber(entitlement.vnBalance) + asPositiveNumber(metadata.packVn),
-        updatedAt: currentIso(),
-      }, { merge: true });
-    });
+    await getEntitlementsRef(uid).set({
+      vnBalance: FieldValue.increment(asPositiveNumber(metadata.packVn)),
+      updatedAt: currentIso(),
+    }, { merge: true });
   }
 };
 
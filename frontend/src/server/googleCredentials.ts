@@ -162,8 +162,13 @@ const tryLoadManyFromPaths = (...envKeys: string[]): GoogleServiceAccount[] => {
   return pool;
 };
 
+let cachedFirebaseAdminAccount: GoogleServiceAccount | null = null;
+let cachedVertexPool: GoogleServiceAccount[] | null = null;
+let cachedCloudTtsPool: GoogleServiceAccount[] | null = null;
+
 export const resolveFirebaseAdminServiceAccount = (): GoogleServiceAccount => {
-  return (
+  if (cachedFirebaseAdminAccount) return cachedFirebaseAdminAccount;
+  cachedFirebaseAdminAccount = (
     tryLoadFromJson('FIREBASE_SERVICE_ACCOUNT_JSON')
     || tryLoadFromPath('GOOGLE_APPLICATION_CREDENTIALS')
     || loadInlineFirebaseServiceAccount()
@@ -173,6 +178,7 @@ export const resolveFirebaseAdminServiceAccount = (): GoogleServiceAccount => {
       );
     })()
   );
+  return cachedFirebaseAdminAccount;
 };
 
 export const resolveVertexServiceAccount = (): GoogleServiceAccount => {
@@ -185,6 +191,7 @@ export const resolveVertexServiceAccount = (): GoogleServiceAccount => {
 };
 
 export const resolveVertexServiceAccountPool = (): GoogleServiceAccount[] => {
+  if (cachedVertexPool) return cachedVertexPool;
   const pool: GoogleServiceAccount[] = [];
   for (const account of tryLoadManyFromPaths(
     'VF_GEMINI_VERTEX_SERVICE_ACCOUNT_FILE',
@@ -192,10 +199,12 @@ export const resolveVertexServiceAccountPool = (): GoogleServiceAccount[] => {
   )) {
     appendUniqueAccount(pool, account);
   }
+  cachedVertexPool = pool;
   return pool;
 };
 
 export const resolveCloudTtsCredentialPool = (): GoogleServiceAccount[] => {
+  if (cachedCloudTtsPool) return cachedCloudTtsPool;
   const pool: GoogleServiceAccount[] = [];
   for (const account of tryLoadManyFromPaths(
     'VF_TTS_TEXTTOSPEECH_SERVICE_ACCOUNT_FILE',
@@ -207,6 +216,7 @@ export const resolveCloudTtsCredentialPool = (): GoogleServiceAccount[] => {
   for (const account of inlinePool) {
     appendUniqueAccount(pool, account);
   }
+  cachedCloudTtsPool = pool;
   return pool;
 };
 
@@ -27,13 +27,14 @@ const ALLOWED_HOST_SUFFIXES = [
   'archive.org',
   'openlibrary.org',
 ];
+const ALLOWED_HOST_MATCHES = ALLOWED_HOST_SUFFIXES.map((suffix) => ({ suffix, dotSuffix: `.${suffix}` }));
 
 const isAllowedHost = (hostname: string): boolean => {
   const safeHostname = String(hostname || '').trim().toLowerCase();
   if (!safeHostname || PRIVATE_HOST_RE.test(safeHostname)) {
     return false;
   }
-  return ALLOWED_HOST_SUFFIXES.some((suffix) => safeHostname === suffix || safeHostname.endsWith(`.${suffix}`));
+  return ALLOWED_HOST_MATCHES.some(({ suffix, dotSuffix }) => safeHostname === suffix || safeHostname.endsWith(dotSuffix));
 };
 
 export const normalizeBookSource = (value: string | null): Book['source'] | undefined => {
@@ -131,12 +132,19 @@ export const handleLibraryBooksRoute = async (request: NextRequest): Promise<Res
         );
       }
 
-      return new Response(await upstream.text(), {
-        headers: {
-          'Content-Type': 'text/plain; charset=utf-8',
-          'Cache-Control': 'no-store',
-        },
-      });
+      const proxyHeaders = {
+        'Content-Type': 'text/plain; charset=utf-8',
+        'Cache-Control': 'no-store',
+      };
+      // Stream UTF-8 bodies through without buffering the whole book; other
+      // charsets must be decoded because the response advertises UTF-8.
+      const upstreamCharset = (/charset=["']?([^;"']+)/i.exec(upstream.headers.get('content-type') || '')?.[1] || 'utf-8')
+        .trim()
+        .toLowerCase();
+      if (upstream.body && ['utf-8', 'utf8', 'ascii', 'us-ascii'].includes(upstreamCharset)) {
+        return new Response(upstream.body, { headers: proxyHeaders });
+      }
+      return new Response(await upstream.text(), { headers: proxyHeaders });
     }
 
     return Response.json(await fetchLibraryBooks(parseDiscoveryOptions(request)), {
@@ -1,8 +1,12 @@
+import { createHash } from 'node:crypto';
+
 import { API_ROUTES } from '../../shared/api/routes';
 
 const MAX_IMPORT_BYTES = 24 * 1024 * 1024;
 const PDF_MIN_TEXT_CHARS = 450;
 const PDF_LOW_DENSITY_THRESHOLD = 0.6;
+// matchAll clones the regex, so the shared global flag carries no state.
+const CHAPTER_HEADING_PATTERN = /^(?:chapter|part)\s+([0-9ivxlcdm]+|one|two|three|four|five|six|seven|eight|nine|ten)?(?:\s*[-:.\u2014]\s*[^\n]{0,100}|[^\n]{0,100})$/gim;
 const NOVEL_IMPORT_MODEL_CANDIDATES = String(
   process.env.VF_NOVEL_IMPORT_MODEL_CANDIDATES
   || process.env.VF_AI_TEXT_MODEL_CANDIDATES
@@ -85,9 +89,10 @@ const normalizeImportText = (raw: string): string => {
     .trim();
 };
 
+const utf8Decoder = new TextDecoder('utf-8', { fatal: false });
+
 const decodeUtf8WithWarnings = (buffer: Buffer): { text: string; warnings: string[] } => {
-  const decoder = new TextDecoder('utf-8', { fatal: false });
-  const text = decoder.decode(buffer);
+  const text = utf8Decoder.decode(buffer);
   const warnings = text.includes('\uFFFD') ? ['txt_decode_replaced_invalid_bytes'] : [];
   return { text, warnings };
 };
@@ -153,6 +158,24 @@ const extractPdfTextLayer = (buffer: Buffer): { text: string; pageStats: ImportP
   };
 };
 
+const waitMs = async (ms: number): Promise<void> => {
+  if (ms <= 0) return;
+  await new Promise((resolve) => globalThis.setTimeout(resolve, ms));
+};
+
+const parseRetryAfterMs = (value: string | null): number => {
+  const raw = String(value || '').trim();
+  if (!raw) return 0;
+  const seconds = Number(raw);
+  if (Number.isFinite(seconds)) {
+    return Math.max(0, Math.round(seconds * 1000));
+  }
+  const dateMs = Date.parse(raw);
+  return Number.isFinite(dateMs) ? Math.max(0, dateMs - Date.now()) : 0;
+};
+
+const RATE_LIMIT_BACKOFF_CAP_MS = 30_000;
+
 const extractGeminiText = async (
   payload: Buffer,
   mimeType: string,
@@ -174,33 +197,39 @@ const extractGeminiText = async (
     'Return only plain text.',
   ].join('\n');
 
+  // Encoding and serializing a multi-megabyte document is the dominant CPU
+  // cost here; the body is identical for every model candidate, so both
+  // happen once instead of per retry.
+  const requestBody = JSON.stringify({
+    contents: [
+      {
+        role: 'user',
+        parts: [
+          { text: prompt },
+          {
+            inlineData: {
+              mimeType,
+              data: payload.toString('base64'),
+            },
+          },
+        ],
+      },
+    ],
+    generationConfig: {
+      temperature: 0.1,
+    },
+  });
+
   let lastError: Error | null = null;
-  for (const model of NOVEL_IMPORT_MODEL_CANDIDATES) {
+  for (let attempt = 0; attempt < NOVEL_IMPORT_MODEL_CANDIDATES.length; attempt += 1) {
+    const model = NOVEL_IMPORT_MODEL_CANDIDATES[attempt]!;
     try {
       const response = await fetch(
         `https://generativelanguage.googleapis.com/v1beta/models/${encodeURIComponent(model)}:generateContent?key=${encodeURIComponent(apiKey)}`,
         {
           method: 'POST',
           headers: { 'Content-Type': 'application/json' },
-          body: JSON.stringify({
-            contents: [
-              {
-                role: 'user',
-                parts: [
-                  { text: prompt },
-                  {
-                    inlineData: {
-                      mimeType,
-                      data: payload.toString('base64'),
-                    },
-                  },
-                ],
-              },
-            ],
-            generationConfig: {
-              temperature: 0.1,
-            },
-          }),
+          body: requestBody,
           cache: 'no-store',
         },
       );
@@ -210,6 +239,14 @@ const extractGeminiText = async (
         error?: { message?: string };
       } | null;
       if (!response.ok) {
+        // Back off before the next candidate on rate limits instead of
+        // re-hitting the API immediately, honoring Retry-After when present
+        // and adding jitter so concurrent imports do not retry in lockstep.
+        if (response.status === 429 && attempt < NOVEL_IMPORT_MODEL_CANDIDATES.length - 1) {
+          const retryAfterMs = parseRetryAfterMs(response.headers.get('retry-after'));
+          const backoffMs = Math.min(RATE_LIMIT_BACKOFF_CAP_MS, 500 * 2 ** attempt) * Math.random();
+          await waitMs(Math.min(RATE_LIMIT_BACKOFF_CAP_MS, Math.max(retryAfterMs, backoffMs)));
+        }
         throw new Error(String(json?.error?.message || `${response.status} ${response.statusText}`));
       }
       const extracted = String(
@@ -230,8 +267,7 @@ const extractGeminiText = async (
 };
 
 const splitTextByHeadings = (rawText: string): ImportChapterPreview[] => {
-  const pattern = /^(?:chapter|part)\s+([0-9ivxlcdm]+|one|two|three|four|five|six|seven|eight|nine|ten)?(?:\s*[-:.\u2014]\s*[^\n]{0,100}|[^\n]{0,100})$/gim;
-  const matches = Array.from(rawText.matchAll(pattern));
+  const matches = Array.from(rawText.matchAll(CHAPTER_HEADING_PATTERN));
   if (matches.length < 2) {
     return [];
   }
@@ -253,9 +289,22 @@ const splitTextByHeadings = (rawText: string): ImportChapterPreview[] => {
 };
 
 const splitTextByLength = (rawText: string): ImportChapterPreview[] => {
-  const paragraphPattern = /\S[\s\S]*?(?=\n{2,}|\Z)/g;
-  const paragraphMatches = Array.from(rawText.matchAll(paragraphPattern));
-  if (paragraphMatches.length === 0) {
+  // Normalized input separates paragraphs with exactly two newlines, so a
+  // linear split with running offsets replaces the old lazy regex scan. The
+  // regex also carried a ported \Z anchor that JavaScript reads as a literal
+  // "Z", which could cut paragraphs at that letter and drop a final
+  // paragraph with no trailing blank line.
+  const paragraphs: Array<{ text: string; start: number; end: number }> = [];
+  let offset = 0;
+  for (const part of rawText.split('\n\n')) {
+    const text = part.trim();
+    if (text) {
+      const leading = part.length - part.trimStart().length;
+      paragraphs.push({ text, start: offset + leading, end: offset + part.length });
+    }
+    offset += part.length + 2;
+  }
+  if (paragraphs.length === 0) {
     return [];
   }
 
@@ -267,11 +316,8 @@ const splitTextByLength = (rawText: string): ImportChapterPreview[] => {
   const targetWords = 1300;
   const minWords = 700;
 
-  for (const paragraphMatch of paragraphMatches) {
-    const paragraph = String(paragraphMatch[0] || '').trim();
-    if (!paragraph) continue;
+  for (const { text: paragraph, start: paragraphStart, end: paragraphEnd } of paragraphs) {
     const paraWords = paragraph.split(/\s+/).filter(Boolean).length;
-    const paragraphStart = paragraphMatch.index ?? 0;
     if (currentStart === null) {
       currentStart = paragraphStart;
     }
@@ -291,7 +337,7 @@ const splitTextByLength = (rawText: string): ImportChapterPreview[] => {
 
     currentParts.push(paragraph);
     currentWords += paraWords;
-    currentEnd = paragraphStart + paragraphMatch[0].length;
+    currentEnd = paragraphEnd;
   }
 
   if (currentParts.length > 0 && currentStart !== null && currentEnd !== null) {
@@ -306,6 +352,32 @@ const splitTextByLength = (rawText: string): ImportChapterPreview[] => {
   return chunks;
 };
 
+// OCR/Gemini extraction is deterministic for a given payload, so repeat
+// uploads of the same file (common while iterating on an import) are served
+// from a small content-addressed cache instead of re-running the AI call.
+interface ExtractCacheEntry {
+  rawText: string;
+  mode: ImportDiagnosticsMode;
+  warnings: string[];
+  pageStats: ImportPageStat[];
+}
+
+const EXTRACT_CACHE_MAX_ENTRIES = 8;
+const extractResultCache = new Map<string, ExtractCacheEntry>();
+
+const extractCacheKey = (buffer: Buffer, hint: SupportedImportHint, languageHint: string): string => {
+  const digest = createHash('sha256').update(buffer).digest('hex');
+  return `${digest}:${hint}:${languageHint}`;
+};
+
+const storeExtractResult = (key: string, entry: ExtractCacheEntry): void => {
+  if (extractResultCache.size >= EXTRACT_CACHE_MAX_ENTRIES) {
+    const oldestKey = extractResultCache.keys().next().value;
+    if (oldestKey !== undefined) extractResultCache.delete(oldestKey);
+  }
+  extractResultCache.set(key, entry);
+};
+
 export const handlePublishingImportExtractRoute = async (request: Request): Promise<Response> => {
   const form = await request.formData();
   const file = form.get('file');
@@ -329,6 +401,21 @@ export const handlePublishingImportExtractRoute = async (request: Request): Prom
     return Response.json({ error: 'File is too large. Maximum 24MB.' }, { status: 413 });
   }
 
+  const cacheKey = extractCacheKey(buffer, hint, languageHint);
+  const cached = extractResultCache.get(cacheKey);
+  if (cached) {
+    return Response.json({
+      ok: true,
+      rawText: cached.rawText,
+      diagnostics: {
+        mode: cached.mode,
+        warnings: cached.warnings,
+        usedAiFallback: true,
+      },
+      pageStats: cached.pageStats,
+    });
+  }
+
   const warnings: string[] = [];
   let pageStats: ImportPageStat[] = [];
   let usedAiFallback = false;
@@ -375,6 +462,12 @@ export const handlePublishingImportExtractRoute = async (request: Request): Prom
     return Response.json({ error: 'No text could be extracted from the uploaded file.' }, { status: 422 });
   }
 
+  // Only AI-backed extractions are worth caching; plain text and PDF text
+  // layers are cheap to re-run and would just evict the expensive entries.
+  if (usedAiFallback) {
+    storeExtractResult(cacheKey, { rawText: normalizedText, mode, warnings, pageStats });
+  }
+
   return Response.json({
     ok: true,
     rawText: normalizedText,
@@ -296,8 +296,10 @@ const chunkStudioText = (text: string, hardCap: number = MAX_TEXT_LENGTH): strin
   return chunks.length > 0 ? chunks : [text.slice(0, hardCap)];
 };
 
+const textEncoder = new TextEncoder();
+
 const getTextByteLength = (value: string): number => (
-  new TextEncoder().encode(String(value || '')).length
+  textEncoder.encode(String(value || '')).length
 );
 
 const planStudioTransport = (request: ReaderStudioSynthesizeRequest): StudioTtsTransportPlan => {
@@ -1038,24 +1040,23 @@ export const handleStudioStreamRoute = async (request: Request): Promise<Respons
     }
     const plan = planStudioTransport(body);
     logStudioTransportPlan('plan', plan, engine);
-    const encoder = new TextEncoder();
 
     const stream = new ReadableStream({
       async start(controller) {
         try {
           if (plan.mode === 'speaker-isolation') {
-            await streamStudioSpeakerIsolationSse(body, controller, encoder, plan);
+            await streamStudioSpeakerIsolationSse(body, controller, textEncoder, plan);
           } else if (plan.canUseBidi) {
-            await streamStudioBidiSse(body, controller, encoder, plan);
+            await streamStudioBidiSse(body, controller, textEncoder, plan);
           } else {
-            await streamStudioFallbackSse(body, controller, encoder, plan);
+            await streamStudioFallbackSse(body, controller, textEncoder, plan);
           }
           controller.close();
         } catch (streamError) {
           const message = streamError instanceof Error ? streamError.message : 'Stream failed.';
           const requestId = String(body.requestId || '').trim() || undefined;
           try {
-            controller.enqueue(encoder.encode(`data: ${JSON.stringify({
+            controller.enqueue(textEncoder.encode(`data: ${JSON.stringify({
               type: 'error',
               message,
               ...(requestId ? { requestId } : {}),
@@ -26,6 +26,14 @@ const DEFAULT_SILENCE_THRESHOLD = 700;
 
 const clamp = (value: number, min: number, max: number): number => Math.max(min, Math.min(max, value));
 
+const IS_LITTLE_ENDIAN = new Uint8Array(new Uint16Array([1]).buffer)[0] === 1;
+
+const viewInt16Samples = (pcmData: Buffer): Int16Array | null => {
+  if (!IS_LITTLE_ENDIAN) return null;
+  const aligned = (pcmData.byteOffset & 1) === 0 ? pcmData : Buffer.from(pcmData);
+  return new Int16Array(aligned.buffer, aligned.byteOffset, Math.floor(aligned.length / 2));
+};
+
 const parseFmtChunk = (chunk: Buffer): { channels: number; sampleRate: number; bitsPerSample: number } | null => {
   if (chunk.length < 16) return null;
   const audioFormat = chunk.readUInt16LE(0);
@@ -107,31 +115,29 @@ export const parseLinear16Wav = (buffer: Buffer): WavParseResult => {
   };
 };
 
-const buildWavHeader = (
+const writeWavHeader = (
+  target: Buffer,
   dataLength: number,
   sampleRate: number,
   channels: number,
   bitsPerSample: number,
-): Buffer => {
-  const header = Buffer.alloc(44);
+): void => {
   const bytesPerFrame = channels * (bitsPerSample / 8);
   const byteRate = sampleRate * bytesPerFrame;
 
-  header.write('RIFF', 0);
-  header.writeUInt32LE(36 + dataLength, 4);
-  header.write('WAVE', 8);
-  header.write('fmt ', 12);
-  header.writeUInt32LE(16, 16);
-  header.writeUInt16LE(1, 20);
-  header.writeUInt16LE(channels, 22);
-  header.writeUInt32LE(sampleRate, 24);
-  header.writeUInt32LE(byteRate, 28);
-  header.writeUInt16LE(bytesPerFrame, 32);
-  header.writeUInt16LE(bitsPerSample, 34);
-  header.write('data', 36);
-  header.writeUInt32LE(dataLength, 40);
-
-  return header;
+  target.write('RIFF', 0);
+  target.writeUInt32LE(36 + dataLength, 4);
+  target.write('WAVE', 8);
+  target.write('fmt ', 12);
+  target.writeUInt32LE(16, 16);
+  target.writeUInt16LE(1, 20);
+  target.writeUInt16LE(channels, 22);
+  target.writeUInt32LE(sampleRate, 24);
+  target.writeUInt32LE(byteRate, 28);
+  target.writeUInt16LE(bytesPerFrame, 32);
+  target.writeUInt16LE(bitsPerSample, 34);
+  target.write('data', 36);
+  target.writeUInt32LE(dataLength, 40);
 };
 
 export const buildLinear16WavFromPcm = (
@@ -141,10 +147,10 @@ export const buildLinear16WavFromPcm = (
   bitsPerSample: number,
 ): Buffer => {
   const safe = Buffer.isBuffer(pcmData) ? pcmData : Buffer.from(pcmData || []);
-  return Buffer.concat([
-    buildWavHeader(safe.length, sampleRate, channels, bitsPerSample),
-    safe,
-  ]);
+  const wav = Buffer.allocUnsafe(44 + safe.length);
+  writeWavHeader(wav, safe.length, sampleRate, channels, bitsPerSample);
+  safe.copy(wav, 44);
+  return wav;
 };
 
 export const buildSilencePcm = (
@@ -176,10 +182,13 @@ const detectSilenceCutFrames = (
   const minSilenceFrames = Math.max(1, Math.floor((sampleRate * minSilenceMs) / 1000));
   const threshold = Math.max(0, Math.floor(silenceThreshold));
   const cutFrames: number[] = [];
+  const samples = viewInt16Samples(pcmData);
 
   let runStart = -1;
   for (let frameIndex = 0; frameIndex < totalFrames; frameIndex += 1) {
-    const sample = pcmData.readInt16LE(frameIndex * bytesPerFrame);
+    const sample = samples
+      ? samples[frameIndex * channels]!
+      : pcmData.readInt16LE(frameIndex * bytesPerFrame);
     const isSilent = Math.abs(sample) <= threshold;
 
     if (isSilent) {
@@ -243,7 +252,8 @@ const splitFramesByCuts = (
 ): Buffer[] => {
   const bytesPerFrame = channels * BYTES_PER_SAMPLE;
   const totalFrames = Math.floor(pcmData.length / bytesPerFrame);
-  const sortedCuts = [...cutFrames].sort((a, b) => a - b).filter((frame) => frame > 0 && frame < totalFrames);
+  // pickCutFrames yields strictly increasing frames, so only bounds filtering is needed.
+  const sortedCuts = cutFrames.filter((frame) => frame > 0 && frame < totalFrames);
 
   const segments: Buffer[] = [];
   let startFrame = 0;
@@ -296,6 +296,7 @@ export const synthesizeSpeakerIsolationWav = async (
     pauseMap.set(pause.timelineIndex, pause.durationMs);
   }
 
+  const lineGapPcm = buildSilencePcm(DEFAULT_LINE_GAP_MS, sampleRate, channels, bitsPerSample);
   const stitchedPcmSegments: Buffer[] = [];
   for (let eventIndex = 0; eventIndex < timeline.eventOrder.length; eventIndex += 1) {
     const event = timeline.eventOrder[eventIndex]!;
@@ -315,7 +316,7 @@ export const synthesizeSpeakerIsolationWav = async (
 
     const hasNext = eventIndex < timeline.eventOrder.length - 1;
     if (hasNext) {
-      stitchedPcmSegments.push(buildSilencePcm(DEFAULT_LINE_GAP_MS, sampleRate, channels, bitsPerSample));
+      stitchedPcmSegments.push(lineGapPcm);
     }
   }
 
@@ -18,23 +18,35 @@ export interface SupportAutomationResult {
 const asString = (value: unknown): string => String(value ?? '').trim();
 const asLower = (value: unknown): string => asString(value).toLowerCase();
 
-const deriveSupportCategory = (text: string): string => {
-  const lower = asLower(text);
-  if (/(refund|charge|charged|billing|invoice|payment|wallet|coupon|subscription)/.test(lower)) return 'billing';
-  if (/(login|password|sign[ -]?in|account locked|locked out|cannot access|can.t access)/.test(lower)) return 'account';
-  if (/(voice clone|clone|reference audio|separate|separation)/.test(lower)) return 'voice_clone';
-  if (/(publish|chapter audio|book|reader|library)/.test(lower)) return 'publishing';
-  if (/(tts|studio|generate|generation|audio novel|novel)/.test(lower)) return 'generation';
-  if (/(abuse|report|copyright|dmca|illegal|fraud|spam)/.test(lower)) return 'abuse';
-  if (/(feature request|idea|wish|roadmap)/.test(lower)) return 'feature_request';
+const SUPPORT_CATEGORY_RULES: ReadonlyArray<readonly [string, RegExp]> = [
+  ['billing', /(refund|charge|charged|billing|invoice|payment|wallet|coupon|subscription)/],
+  ['account', /(login|password|sign[ -]?in|account locked|locked out|cannot access|can.t access)/],
+  ['voice_clone', /(voice clone|clone|reference audio|separate|separation)/],
+  ['publishing', /(publish|chapter audio|book|reader|library)/],
+  ['generation', /(tts|studio|generate|generation|audio novel|novel)/],
+  ['abuse', /(abuse|report|copyright|dmca|illegal|fraud|spam)/],
+  ['feature_request', /(feature request|idea|wish|roadmap)/],
+];
+
+const SUPPORT_URGENCY_RULES: ReadonlyArray<readonly [SupportAutomationResult['urgency'], RegExp]> = [
+  ['critical', /(security|legal|dmca|charged twice|charged but|data loss|account locked|locked out|urgent|refund now)/],
+  ['high', /(cannot|can't|cant|failed|broken|blocked|stuck|not working|issue)/],
+  ['medium', /(slow|question|help|clarify)/],
+];
+
+const SUPPORT_BLOCKED_RE = /(cannot|can't|cant|blocked|stuck|unable|won.t let me)/;
+
+const deriveSupportCategory = (lowerText: string): string => {
+  for (const [category, pattern] of SUPPORT_CATEGORY_RULES) {
+    if (pattern.test(lowerText)) return category;
+  }
   return 'general';
 };
 
-const deriveSupportUrgency = (text: string): SupportAutomationResult['urgency'] => {
-  const lower = asLower(text);
-  if (/(security|legal|dmca|charged twice|charged but|data loss|account locked|locked out|urgent|refund now)/.test(lower)) return 'critical';
-  if (/(cannot|can't|cant|failed|broken|blocked|stuck|not working|issue)/.test(lower)) return 'high';
-  if (/(slow|question|help|clarify)/.test(lower)) return 'medium';
+const deriveSupportUrgency = (lowerText: string): SupportAutomationResult['urgency'] => {
+  for (const [urgency, pattern] of SUPPORT_URGENCY_RULES) {
+    if (pattern.test(lowerText)) return urgency;
+  }
   return 'low';
 };
 
@@ -70,9 +82,10 @@ export const analyzeSupportRequest = (
     ...((input.context || []).map((entry) => asString(entry)).filter(Boolean)),
     asString(input.text),
   ].join('\n');
-  const category = deriveSupportCategory(joinedText);
-  const urgency = deriveSupportUrgency(joinedText);
-  const blocked = /(cannot|can't|cant|blocked|stuck|unable|won.t let me)/.test(asLower(joinedText));
+  const lowerText = asLower(joinedText);
+  const category = deriveSupportCategory(lowerText);
+  const urgency = deriveSupportUrgency(lowerText);
+  const blocked = SUPPORT_BLOCKED_RE.test(lowerText);
   const needsHuman = ['billing', 'account', 'abuse'].includes(category) || urgency === 'critical';
   const suggestedMacro = category === 'billing'
     ? 'billing_triage'
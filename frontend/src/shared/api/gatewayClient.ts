@@ -621,7 +621,7 @@ export const fetchRoutingBackendCandidates = async (options?: {
       fetchedAt: String(routingSnapshot?.fetchedAt || nowIso),
     };
   } catch {
-    const startedAtMs = Date.now();
+    const startedAtMs = globalThis.performance.now();
     const healthUrl = resolveApiUrl('/health', baseUrl);
     try {
       const healthSnapshot = await fetchPublicJsonWithTimeout<Record<string, unknown>>('/health', {
@@ -653,7 +653,7 @@ export const fetchRoutingBackendCandidates = async (options?: {
           },
           healthUrl,
           runtimeUrl: baseUrl,
-          latencyMs: Math.max(0, Date.now() - startedAtMs),
+          latencyMs: Math.max(0, Math.round(globalThis.performance.now() - startedAtMs)),
           queueDepth: 0,
           oldestQueuedAgeMs: 0,
         }],
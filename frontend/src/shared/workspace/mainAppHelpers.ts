@@ -65,15 +65,28 @@ const normalizeEngineTokenKey = (value: unknown): string => (
     .replace(/^_+|_+$/g, '')
 );
 
+// Engine labels arrive from settings, snapshots and API payloads on every
+// render pass, but the distinct inputs are a handful of tokens, so the
+// resolution is memoized.
+const ENGINE_TOKEN_MEMO_MAX_ENTRIES = 64;
+const engineTokenMemo = new Map<string, string>();
+
 export const resolveEngineToken = (value: unknown): string => {
   const raw = String(value || '').trim();
   if (!raw) return '';
+  const cached = engineTokenMemo.get(raw);
+  if (cached !== undefined) return cached;
   const canonical = normalizeEngineTokenKey(raw);
   const legacy = LEGACY_ENGINE_TOKEN_MAP[canonical];
-  if (legacy) return legacy;
-  return CANONICAL_ENGINE_TOKENS.has(canonical as GenerationSettings['engine'])
+  const resolved = legacy || (CANONICAL_ENGINE_TOKENS.has(canonical as GenerationSettings['engine'])
     ? canonical
-    : raw;
+    : raw);
+  if (engineTokenMemo.size >= ENGINE_TOKEN_MEMO_MAX_ENTRIES) {
+    const oldestKey = engineTokenMemo.keys().next().value;
+    if (oldestKey !== undefined) engineTokenMemo.delete(oldestKey);
+  }
+  engineTokenMemo.set(raw, resolved);
+  return resolved;
 };
 
 export const normalizeEngineToken = (
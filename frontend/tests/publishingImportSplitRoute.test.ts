@@ -0,0 +1,52 @@
+import { describe, expect, it } from 'vitest';
+
+import { handlePublishingImportSplitRoute } from '../src/server/publishing/importService';
+
+const splitRequest = (rawText: string, strategy = 'length_fallback'): Request =>
+  new Request('http://localhost/api/v1/publishing/import/split', {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ rawText, strategy }),
+  });
+
+describe('publishing import split route', () => {
+  it('keeps capital-Z text and a final paragraph with no trailing blank line', async () => {
+    // The ported splitter regex carried a \Z anchor that JavaScript reads as
+    // a literal "Z", which truncated paragraphs at that letter and dropped a
+    // final paragraph lacking a trailing blank line.
+    const rawText = [
+      'Zara boarded the Zeppelin at dawn with zero hesitation.',
+      'The Zanzibar coastline drifted by below, hazy and quiet.',
+      'Zeno waved once from the quay and did not look back.',
+    ].join('\n\n');
+
+    const response = await handlePublishingImportSplitRoute(splitRequest(rawText));
+    expect(response.status).toBe(200);
+
+    const payload = await response.json();
+    expect(payload.ok).toBe(true);
+    expect(payload.chapters).toHaveLength(1);
+    expect(payload.chapters[0]).toMatchObject({
+      title: 'Chapter 001',
+      text: rawText,
+      startOffset: 0,
+      endOffset: rawText.length,
+    });
+  });
+
+  it('reports offsets that slice the submitted text back out', async () => {
+    const paragraph = (seed: number): string =>
+      Array.from({ length: 100 }, (_, index) => `word${seed}x${index}`).join(' ');
+    const rawText = Array.from({ length: 20 }, (_, index) => paragraph(index)).join('\n\n');
+
+    const response = await handlePublishingImportSplitRoute(splitRequest(rawText));
+    expect(response.status).toBe(200);
+
+    const payload = await response.json();
+    expect(payload.chapters.length).toBeGreaterThan(1);
+    for (const chapter of payload.chapters) {
+      expect(rawText.slice(chapter.startOffset, chapter.endOffset).trim()).toBe(chapter.text);
+    }
+    expect(payload.chapters.at(-1).endOffset).toBe(rawText.length);
+  });
+});
@@ -10,10 +10,16 @@ vi.mock('../src/server/firebaseAdmin.ts', () => ({
   }),
 }));
 
+const bearerRequest = (token: string): Request =>
+  new Request('http://localhost/api/v1/library/audio-novel/jobs', {
+    headers: { authorization: `Bearer ${token}` },
+  });
+
 describe('request auth helpers', () => {
   afterEach(() => {
     vi.clearAllMocks();
     vi.resetModules();
+    vi.useRealTimers();
     delete process.env.VF_DEV_UID_HEADER_ENABLED;
     delete process.env.NEXT_PUBLIC_ENABLE_DEV_UID_HEADER;
   });
@@ -35,4 +41,77 @@ describe('request auth helpers', () => {
     expect(verifyIdTokenMock).not.toHaveBeenCalled();
     expect(verifySessionCookieMock).toHaveBeenCalledWith('session-cookie-token', true);
   });
+
+  it('serves repeat bearer verifications from the decoded-token cache', async () => {
+    vi.useFakeTimers();
+    vi.setSystemTime(new Date('2026-08-29T00:00:00Z'));
+    const exp = Math.floor(Date.now() / 1000) + 3600;
+    verifyIdTokenMock.mockResolvedValue({ uid: 'bearer-user', exp });
+
+    const { verifyFirebaseRequest } = await import('../src/server/auth/requestAuth');
+    await expect(verifyFirebaseRequest(bearerRequest('token-a'))).resolves.toMatchObject({ uid: 'bearer-user' });
+    await expect(verifyFirebaseRequest(bearerRequest('token-a'))).resolves.toMatchObject({ uid: 'bearer-user' });
+
+    expect(verifyIdTokenMock).toHaveBeenCalledTimes(1);
+  });
+
+  it('re-verifies once the five-minute cache window elapses', async () => {
+    vi.useFakeTimers();
+    vi.setSystemTime(new Date('2026-08-29T00:00:00Z'));
+    const exp = Math.floor(Date.now() / 1000) + 3600;
+    verifyIdTokenMock.mockResolvedValue({ uid: 'bearer-user', exp });
+
+    const { verifyFirebaseRequest } = await import('../src/server/auth/requestAuth');
+    await verifyFirebaseRequest(bearerRequest('token-a'));
+    vi.setSystemTime(new Date('2026-08-29T00:05:00Z'));
+    await verifyFirebaseRequest(bearerRequest('token-a'));
+
+    expect(verifyIdTokenMock).toHaveBeenCalledTimes(2);
+  });
+
+  it('never serves a cached entry past the token expiry', async () => {
+    vi.useFakeTimers();
+    vi.setSystemTime(new Date('2026-08-29T00:00:00Z'));
+    const exp = Math.floor(Date.now() / 1000) + 60;
+    verifyIdTokenMock.mockResolvedValue({ uid: 'bearer-user', exp });
+
+    const { verifyFirebaseRequest } = await import('../src/server/auth/requestAuth');
+    await verifyFirebaseRequest(bearerRequest('token-a'));
+    vi.setSystemTime(new Date('2026-08-29T00:01:00Z'));
+    await verifyFirebaseRequest(bearerRequest('token-a'));
+
+    expect(verifyIdTokenMock).toHaveBeenCalledTimes(2);
+  });
+
+  it('does not cache a token whose expiry is already in the past', async () => {
+    vi.useFakeTimers();
+    vi.setSystemTime(new Date('2026-08-29T00:00:00Z'));
+    const exp = Math.floor(Date.now() / 1000) - 1;
+    verifyIdTokenMock.mockResolvedValue({ uid: 'bearer-user', exp });
+
+    const { verifyFirebaseRequest } = await import('../src/server/auth/requestAuth');
+    await verifyFirebaseRequest(bearerRequest('token-a'));
+    await verifyFirebaseRequest(bearerRequest('token-a'));
+
+    expect(verifyIdTokenMock).toHaveBeenCalledTimes(2);
+  });
+
+  it('evicts the oldest cached token once the cache is full', async () => {
+    vi.useFakeTimers();
+    vi.setSystemTime(new Date('2026-08-29T00:00:00Z'));
+    const exp = Math.floor(Date.now() / 1000) + 3600;
+    verifyIdTokenMock.mockResolvedValue({ uid: 'bearer-user', exp });
+
+    const { verifyFirebaseRequest } = await import('../src/server/auth/requestAuth');
+    for (let index = 0; index <= 2048; index += 1) {
+      await verifyFirebaseRequest(bearerRequest(`token-${index}`));
+    }
+    expect(verifyIdTokenMock).toHaveBeenCalledTimes(2049);
+
+    // token-2048 pushed token-0 out; the rest are still served from cache.
+    await verifyFirebaseRequest(bearerRequest('token-2048'));
+    expect(verifyIdTokenMock).toHaveBeenCalledTimes(2049);
+    await verifyFirebaseRequest(bearerRequest('token-0'));
+    expect(verifyIdTokenMock).toHaveBeenCalledTimes(2050);
+  });
 });